@@ -0,0 +1,22 @@
+"""Shared mmap helpers for the register page."""
+
+import mmap
+
+__all__ = ['MAP_FLAGS', 'advise']
+
+# Prefault the register page at mmap time where the platform supports it
+MAP_FLAGS = mmap.MAP_SHARED | getattr(mmap, 'MAP_POPULATE', 0)
+
+def advise(mm, scattered=False):
+    """Ask the kernel to fault the mapping in up front (best effort).
+
+    With scattered=True also advise MADV_RANDOM, for callers that touch
+    registers all over the page rather than one word or window.
+    """
+    names = ('MADV_WILLNEED', 'MADV_RANDOM') if scattered else ('MADV_WILLNEED',)
+    for name in names:
+        try:
+            mm.madvise(getattr(mmap, name))
+        except (AttributeError, OSError):
+            # no madvise/constant on this platform, or a device mapping refused it
+            pass
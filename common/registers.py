@@ -1,4 +1,6 @@
 
+import struct
+
 # Offsets for the fake sensor register block
 MAGIC     = 0x000
 VERSION   = 0x004
@@ -24,6 +26,14 @@ BAT_I     = 0x058
 RNG_SEED  = 0x100
 CTRL      = 0x104
 
+# Sample block TICK_US .. BAT_I, packed little-endian with no gaps:
+# tick, accel xyz, gyro xyz, mag xyz, baro press/temp, gps lat/lon (f64),
+# gps alt, airspeed, battery V/I
+SAMPLE = struct.Struct('<I11f2d4f')
+
+# Single 32-bit register (header words, TICK_US, RNG_SEED, CTRL)
+U32 = struct.Struct('<I')
+
 PAGE_SIZE = 4096
 DEFAULT_SHM_PATH = "/dev/shm/sim_sensor.bin"
 DEFAULT_UIO = "/dev/uio0"
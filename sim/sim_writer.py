@@ -1,7 +1,8 @@
 
 #!/usr/bin/env python3
-import argparse, mmap, os, struct, time, math, random
+import argparse, mmap, os, time, math, random
 from common.registers import *
+from common.mapping import MAP_FLAGS, advise
 from sim.scenarios import loiter_brasilia, eddf_approach
 
 def ensure_shm(path, size):
@@ -10,21 +11,19 @@ def ensure_shm(path, size):
     return fd
 
 def open_map(backend, uio_path, shm_path):
+    # No O_SYNC: it governs write(2), not stores through the mapping, and the
+    # UIO driver (not the open flags) decides how its page is cached
     if backend == "uio":
-        fd = os.open(uio_path, os.O_RDWR | os.O_SYNC)
-        mm = mmap.mmap(fd, PAGE_SIZE, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
-        return fd, mm
+        fd = os.open(uio_path, os.O_RDWR)
     elif backend == "shm":
         fd = ensure_shm(shm_path, PAGE_SIZE)
-        mm = mmap.mmap(fd, PAGE_SIZE, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
-        return fd, mm
     else:
         raise SystemExit("unknown backend: " + backend)
+    mm = mmap.mmap(fd, PAGE_SIZE, MAP_FLAGS, mmap.PROT_READ | mmap.PROT_WRITE)
+    advise(mm, scattered=True)
+    return fd, mm
 
-def pack_u32(mem, off, v): mem.seek(off); mem.write(struct.pack('<I', v & 0xffffffff))
-def pack_f32(mem, off, v): mem.seek(off); mem.write(struct.pack('<f', float(v)))
-def pack_f64(mem, off, v): mem.seek(off); mem.write(struct.pack('<d', float(v)))
-def rd_u32(mem, off): mem.seek(off); return struct.unpack('<I', mem.read(4))[0]
+def pack_u32(mem, off, v): U32.pack_into(mem, off, v & 0xffffffff)
 
 def main():
     ap = argparse.ArgumentParser(description="Flight sensor simulator (UIO or SHM)")
@@ -47,41 +46,53 @@ def main():
 
     print(f"[sim] backend={args.backend} rate={args.rate}Hz | CTRL bits: 0=freeze 1=scenario(0 loiter,1 EDDF) 2=noise")
     period = 1.0 / max(1e-6, args.rate)
-    start = time.time()
+    start = time.monotonic()
+    deadline = start
+    # Bind hot-loop callables once instead of resolving them every tick
+    gauss = random.gauss
+    monotonic = time.monotonic
+    pack_sample = SAMPLE.pack_into
+    unpack_u32 = U32.unpack_from
 
     try:
         while True:
-            now = time.time()
+            # Pace on absolute deadlines so work time doesn't accumulate as drift
+            now = monotonic()
+            if deadline > now:
+                time.sleep(deadline - now)
+                now = monotonic()
+            elif now - deadline > period:
+                deadline = now    # overran a whole tick: re-anchor, don't burst
+            deadline += period
             t = now - start
-            pack_u32(mem, TICK_US, int(t * 1e6))
 
-            ctrl = rd_u32(mem, CTRL)
+            ctrl = unpack_u32(mem, CTRL)[0]
             if ctrl & 0x1:    # freeze
-                time.sleep(period)
+                pack_u32(mem, TICK_US, int(t * 1e6))
                 continue
 
             # Choose scenario (bit1)
             vals = eddf_approach(t) if (ctrl & 0x2) else loiter_brasilia(t)
 
+            (ax, ay, az, gx, gy, gz, mx, my, mz, press, tempc,
+             lat, lon, alt, airspeed, bat_v, bat_i) = vals
+
             # Optional noise (bit2)
             if ctrl & 0x4:
-                def n(s, sd=0.02): return s + random.gauss(0, sd)
-                for k in ['ax','ay','az','gx','gy','gz']:
-                    vals[k] = n(vals[k])
-                vals['press'] = n(vals['press'], 1.5)
-                vals['tempc'] = n(vals['tempc'], 0.1)
-                vals['airspeed'] = n(vals['airspeed'], 0.2)
+                ax += gauss(0.0, 0.02)
+                ay += gauss(0.0, 0.02)
+                az += gauss(0.0, 0.02)
+                gx += gauss(0.0, 0.02)
+                gy += gauss(0.0, 0.02)
+                gz += gauss(0.0, 0.02)
+                press += gauss(0.0, 1.5)
+                tempc += gauss(0.0, 0.1)
+                airspeed += gauss(0.0, 0.2)
 
             # Write all registers
-            pack_f32(mem, ACCEL_X, vals['ax']); pack_f32(mem, ACCEL_Y, vals['ay']); pack_f32(mem, ACCEL_Z, vals['az'])
-            pack_f32(mem, GYRO_X,  vals['gx']); pack_f32(mem, GYRO_Y,  vals['gy']); pack_f32(mem, GYRO_Z,  vals['gz'])
-            pack_f32(mem, MAG_X,   vals['mx']); pack_f32(mem, MAG_Y,   vals['my']); pack_f32(mem, MAG_Z,   vals['mz'])
-            pack_f32(mem, BARO_P,  vals['press']); pack_f32(mem, BARO_T, vals['tempc'])
-            pack_f64(mem, GPS_LAT64, vals['lat']); pack_f64(mem, GPS_LON64, vals['lon']); pack_f32(mem, GPS_ALT, vals['alt'])
-            pack_f32(mem, AIRSPEED, vals['airspeed'])
-            pack_f32(mem, BAT_V, vals['bat_v']); pack_f32(mem, BAT_I, vals['bat_i'])
-
-            time.sleep(period)
+            pack_sample(mem, TICK_US, int(t * 1e6) & 0xffffffff,
+                        ax, ay, az, gx, gy, gz, mx, my, mz, press, tempc,
+                        lat, lon, alt, airspeed, bat_v, bat_i)
     except KeyboardInterrupt:
         pass
     finally:
@@ -1,7 +1,8 @@
 
 #!/usr/bin/env python3
-import argparse, mmap, os, struct
+import argparse, mmap, os
 from common.registers import *
+from common.mapping import MAP_FLAGS, advise
 
 def main():
     ap = argparse.ArgumentParser(description="Set/clear CTRL bits")
@@ -13,13 +14,14 @@ def main():
     args = ap.parse_args()
 
     if args.backend == 'uio':
-        fd = os.open(args.uio, os.O_RDWR | os.O_SYNC)
+        fd = os.open(args.uio, os.O_RDWR)
     else:
-        fd = os.open(args.shm, os.O_RDWR | os.O_SYNC)
+        fd = os.open(args.shm, os.O_RDWR)
 
-    mem = mmap.mmap(fd, PAGE_SIZE, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+    mem = mmap.mmap(fd, PAGE_SIZE, MAP_FLAGS, mmap.PROT_READ | mmap.PROT_WRITE)
+    advise(mem)
 
-    mem.seek(CTRL); val = struct.unpack('<I', mem.read(4))[0]
+    val = U32.unpack_from(mem, CTRL)[0]
     original = val
 
     if args.set > 0:
@@ -27,7 +29,7 @@ def main():
     if args.clear > 0:
         val &= ~(1 << (args.clear-1))
 
-    mem.seek(CTRL); mem.write(struct.pack('<I', val))
+    U32.pack_into(mem, CTRL, val)
     mem.flush()
 
     print(f"CTRL: 0x{original:08X} -> 0x{val:08X}")
@@ -1,21 +1,21 @@
 
 #!/usr/bin/env python3
-import argparse, mmap, os, struct, time
+import argparse, mmap, os, struct, sys, time
 from common.registers import *
+from common.mapping import MAP_FLAGS, advise
 
 def open_map(backend, uio_path, shm_path):
-    if backend == "uio":
-        fd = os.open(uio_path, os.O_RDONLY)
-        mm = mmap.mmap(fd, PAGE_SIZE, mmap.MAP_SHARED, mmap.PROT_READ)
-        return fd, mm
-    else:
-        fd = os.open(shm_path, os.O_RDONLY)
-        mm = mmap.mmap(fd, PAGE_SIZE, mmap.MAP_SHARED, mmap.PROT_READ)
-        return fd, mm
+    fd = os.open(uio_path if backend == "uio" else shm_path, os.O_RDONLY)
+    mm = mmap.mmap(fd, PAGE_SIZE, MAP_FLAGS, mmap.PROT_READ)
+    advise(mm)
+    return fd, mm
 
-def rf32(mem, off): mem.seek(off); return struct.unpack('<f', mem.read(4))[0]
-def ru32(mem, off): mem.seek(off); return struct.unpack('<I', mem.read(4))[0]
-def rf64(mem, off): mem.seek(off); return struct.unpack('<d', mem.read(8))[0]
+# TICK_US .. AIRSPEED, pad bytes skip the registers that aren't printed:
+# tick, accel x, gyro z, gps lat/lon (f64), gps alt, airspeed
+WINDOW = struct.Struct('<If16xf20xddff')
+
+def fmt(tick, ax, gz, lat, lon, alt, v):
+    return f"tick={tick:10d} ax={ax:+.3f} gz={gz:+.3f} v={v:5.2f} lat={lat:+.6f} lon={lon:+.6f} alt={alt:6.1f}"
 
 def main():
     ap = argparse.ArgumentParser()
@@ -24,16 +24,27 @@ def main():
     ap.add_argument('--shm', default=DEFAULT_SHM_PATH)
     ap.add_argument('--count', type=int, default=20)
     ap.add_argument('--interval', type=float, default=0.2)
+    ap.add_argument('--batch', action='store_true',
+                    help='collect all samples and print them in one write at the end')
     args = ap.parse_args()
 
     fd, mem = open_map(args.backend, args.uio, args.shm)
     try:
-        for _ in range(args.count):
-            tick = ru32(mem, TICK_US)
-            ax = rf32(mem, ACCEL_X); gz = rf32(mem, GYRO_Z); v = rf32(mem, AIRSPEED)
-            lat = rf64(mem, GPS_LAT64); lon = rf64(mem, GPS_LON64); alt = rf32(mem, GPS_ALT)
-            print(f"tick={tick:10d} ax={ax:+.3f} gz={gz:+.3f} v={v:5.2f} lat={lat:+.6f} lon={lon:+.6f} alt={alt:6.1f}")
-            time.sleep(args.interval)
+        rows = [None] * args.count if args.batch else None
+        deadline = time.monotonic()
+        for i in range(args.count):
+            sample = WINDOW.unpack_from(mem, TICK_US)
+            if rows is None:
+                print(fmt(*sample))
+            else:
+                rows[i] = sample
+            # sleep to an absolute deadline so print time doesn't add drift
+            deadline += args.interval
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        if rows:
+            sys.stdout.write("".join(fmt(*r) + "\n" for r in rows))
     finally:
         mem.close(); os.close(fd)
 
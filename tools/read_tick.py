@@ -1,7 +1,8 @@
 
 #!/usr/bin/env python3
-import argparse, mmap, os, struct, time
+import argparse, mmap, os, time
 from common.registers import *
+from common.mapping import MAP_FLAGS, advise
 
 def main():
     ap = argparse.ArgumentParser()
@@ -16,13 +17,17 @@ def main():
     else:
         fd = os.open(args.shm, os.O_RDONLY)
 
-    mem = mmap.mmap(fd, PAGE_SIZE, mmap.MAP_SHARED, mmap.PROT_READ)
+    mem = mmap.mmap(fd, PAGE_SIZE, MAP_FLAGS, mmap.PROT_READ)
+    advise(mem)
     try:
+        deadline = time.monotonic()
         for _ in range(args.count):
-            mem.seek(TICK_US)
-            t = struct.unpack('<I', mem.read(4))[0]
+            t = U32.unpack_from(mem, TICK_US)[0]
             print(t)
-            time.sleep(0.2)
+            deadline += 0.2
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
     finally:
         mem.close(); os.close(fd)
 